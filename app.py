@@ -16,10 +16,26 @@ Features:
 import gradio as gr
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: fall back to the stdlib json module
+
+try:
+    from rtree import index as rtree_index
+except ImportError:
+    rtree_index = None  # Optional: fall back to uniform grid bucketing
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Optional: hit-test with a NumPy mask instead
+
 # ============================================================================
 # Configuration and Constants
 # ============================================================================
@@ -36,22 +52,77 @@ COLOR_MAP = {
     "H2": "#FF6B00",      # Orange for subheadings
     "H3": "#FFA500",      # Light orange
     "P": "#0000FF",       # Blue for paragraphs
+    "ParagraphSpan": "#0000FF",  # ...including spans split out of a paragraph
     "Figure": "#00FF00",  # Green for figures
     "Table": "#FF00FF",   # Magenta for tables
     "L": "#00FFFF",       # Cyan for lists
+    "LI": "#00FFFF",      # ...and their items,
+    "Lbl": "#00FFFF",     # item labels (bullets/numbers)
+    "LBody": "#00FFFF",   # and item bodies
     "default": "#FFFF00"  # Yellow for other elements
 }
 
+# The same colors as (r, g, b) tuples, parsed once for translucent fills
+COLOR_MAP_RGB = {
+    key: tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
+    for key, color in COLOR_MAP.items()
+}
+
 # Line width for bounding boxes
 BBOX_LINE_WIDTH = 2
 # Line width for highlighted (selected) bounding box
 HIGHLIGHT_LINE_WIDTH = 4
 
+# Maximum number of rendered page images kept in memory
+RENDER_CACHE_SIZE = 16
+
+# Maximum number of element blocks rendered expanded in the JSON panel.
+# Elements outside this window (centered on the highlighted one) start collapsed.
+JSON_WINDOW_SIZE = 50
+
+# Longest side (in pixels) of the page image sent to the browser.
+# Page PNGs are rendered at print resolution (2550 x 3300), far more than the viewer shows.
+MAX_DISPLAY_DIM = 1200
+
+# Number of cells per axis for the click hit-test grid (used when rtree is unavailable)
+HIT_GRID_SIZE = 10
+
 
 # ============================================================================
 # Helper Functions for Data Loading
 # ============================================================================
 
+def json_loads(raw):
+    """
+    Parse a JSON document, using orjson's C parser when it is installed.
+    
+    Args:
+        raw (str or bytes): JSON text
+    
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_pretty(obj):
+    """
+    Serialize a value as JSON indented by 2 spaces, using orjson when installed.
+    
+    Args:
+        obj: JSON-serializable value
+    
+    Returns:
+        str: Pretty-printed JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    # orjson writes non-ASCII text as-is; match it so the panel looks the same either way
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def get_available_documents():
     """
     Scan the XML directory to find all available documents.
@@ -62,8 +133,24 @@ def get_available_documents():
     if not XML_DIR.exists():
         return []
     
-    json_files = sorted(XML_DIR.glob("*.json"))
-    return [f.stem for f in json_files]
+    # A directory's mtime changes whenever files are added, removed or renamed
+    return list(_scan_documents(str(XML_DIR), XML_DIR.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=1)
+def _scan_documents(xml_dir, mtime):
+    """
+    List the document JSON files in a directory, memoized by directory mtime.
+    
+    Args:
+        xml_dir (str): Directory containing the JSON metadata files
+        mtime (int): Directory modification time in nanoseconds (cache key only)
+    
+    Returns:
+        tuple: Sorted document names (without .json extension)
+    """
+    json_files = sorted(Path(xml_dir).glob("*.json"))
+    return tuple(f.stem for f in json_files)
 
 
 def load_document_data(document_name):
@@ -81,8 +168,30 @@ def load_document_data(document_name):
     if not json_path.exists():
         return None
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Key the cache on the file's mtime so edited JSON files are re-read
+    return _load_cached(str(json_path), json_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_cached(json_path, mtime):
+    """
+    Parse a document JSON file, memoized by path and modification time.
+    
+    Args:
+        json_path (str): Path to the JSON file
+        mtime (int): File modification time in nanoseconds (cache key only)
+    
+    Returns:
+        dict: Parsed JSON data
+    """
+    # Read the whole file in one call and parse the bytes directly
+    # (no text decoding pass; both orjson and json accept UTF-8 bytes)
+    data = json_loads(Path(json_path).read_bytes())
+    
+    # Remember where the data came from so page renders can be cached per file version
+    data["_source"] = (json_path, mtime)
+    index_document(data)
+    return data
 
 
 def get_page_image_path(document_name, page_num):
@@ -128,6 +237,23 @@ def get_element_type(element):
     return "unknown"
 
 
+def get_color_key(element_type):
+    """
+    Get the COLOR_MAP key for an element type.
+    
+    Repeated siblings carry an index in their Path (e.g. "P[2]", "H1[3]"),
+    which is stripped before the exact lookup.
+    
+    Args:
+        element_type (str): Type of the element
+    
+    Returns:
+        str: Key into COLOR_MAP / COLOR_MAP_RGB ("default" if unmapped)
+    """
+    base_type = element_type.split("[", 1)[0]
+    return base_type if base_type in COLOR_MAP else "default"
+
+
 def get_element_color(element_type):
     """
     Get the color for a given element type.
@@ -138,16 +264,128 @@ def get_element_color(element_type):
     Returns:
         str: Hex color code
     """
-    # Check if element type is in any of the predefined colors
-    for key, color in COLOR_MAP.items():
-        if key in element_type:
-            return color
-    return COLOR_MAP["default"]
+    return COLOR_MAP[get_color_key(element_type)]
+
+
+def get_element_color_rgb(element_type):
+    """
+    Get the color for a given element type as an RGB tuple.
+    
+    Args:
+        element_type (str): Type of the element
+    
+    Returns:
+        tuple: (r, g, b) color components
+    """
+    return COLOR_MAP_RGB[get_color_key(element_type)]
+
+
+def index_document(data):
+    """
+    Precompute per-page lookups for a freshly parsed document.
+    
+    Runs once per load so the interactive callbacks never have to scan the
+    full element list or re-parse Path strings. Adds:
+    - data["_by_page"]: {page_num: [elements...]}
+    - data["_bounds_np"]: {page_num: (N, 4) array of PDF Bounds, row-aligned with _by_page}
+    - element["_type"] / element["_color"] / element["_rgb"]: cached type and box color
+    - element["_json_pretty"]: the element's JSON as shown in the metadata panel
+    
+    Keys starting with an underscore are internal and hidden from the JSON panel.
+    
+    Args:
+        data (dict): Parsed document JSON data (modified in place)
+    """
+    by_page = {}
+    for element in data.get("elements", []):
+        # Serialized before any internal keys are added to the element
+        element["_json_pretty"] = json_pretty(public_fields(element))
+        element_type = get_element_type(element)
+        element["_type"] = element_type
+        element["_color"] = get_element_color(element_type)
+        element["_rgb"] = get_element_color_rgb(element_type)
+        by_page.setdefault(element.get("Page"), []).append(element)
+    data["_by_page"] = by_page
+    data["_bounds_np"] = {page: bounds_array(elements) for page, elements in by_page.items()}
+
+
+def bounds_array(elements):
+    """
+    Stack element Bounds into an (N, 4) array of PDF coordinates [x1, y1, x2, y2].
+    
+    Elements without a valid Bounds get a row of NaN, so rows stay aligned
+    with the element list and never match a hit test or get drawn.
+    
+    Args:
+        elements (list): List of elements
+    
+    Returns:
+        np.ndarray: Float array of shape (len(elements), 4)
+    """
+    missing = (np.nan,) * 4
+    rows = [bounds if bounds and len(bounds) == 4 else missing
+            for bounds in (element.get("Bounds") for element in elements)]
+    return np.array(rows, dtype=np.float64).reshape(len(rows), 4)
+
+
+def to_image_rects(bounds, scale_x, scale_y, img_height):
+    """
+    Convert PDF Bounds to image-space rectangles in one vectorized step.
+    
+    PDF coordinates have origin at bottom-left, y increases upward.
+    Image coordinates have origin at top-left, y increases downward.
+    
+    Args:
+        bounds (np.ndarray): (N, 4) PDF coordinates [x1, y1, x2, y2] (y1 is bottom)
+        scale_x (float): Image pixels per PDF point (horizontal)
+        scale_y (float): Image pixels per PDF point (vertical)
+        img_height (int): Image height in pixels (for the Y-axis flip)
+    
+    Returns:
+        np.ndarray: (N, 4) image coordinates [x1, y1, x2, y2] (y1 is top)
+    """
+    rects = np.empty_like(bounds)
+    rects[:, 0] = bounds[:, 0] * scale_x
+    rects[:, 2] = bounds[:, 2] * scale_x
+    rects[:, 1] = img_height - bounds[:, 3] * scale_y  # Top in image (was top in PDF)
+    rects[:, 3] = img_height - bounds[:, 1] * scale_y  # Bottom in image (was bottom in PDF)
+    return rects
+
+
+def get_elements_bounds(data, elements, page_num):
+    """
+    Get the Bounds array for a list of elements, reusing the load-time array
+    when the list is the page's own element list.
+    
+    Args:
+        data (dict): Full document JSON data
+        elements (list): List of elements
+        page_num (int): Page number (0-indexed)
+    
+    Returns:
+        np.ndarray: (N, 4) PDF coordinates, row-aligned with elements
+    """
+    if elements is get_elements_for_page(data, page_num) and "_bounds_np" in data:
+        return data["_bounds_np"][page_num]
+    return bounds_array(elements)
+
+
+def public_fields(element):
+    """
+    Strip internal (underscore-prefixed) keys from an element.
+    
+    Args:
+        element (dict): Element from the JSON data
+    
+    Returns:
+        dict: Element fields as they appear in the source JSON
+    """
+    return {key: value for key, value in element.items() if not key.startswith("_")}
 
 
 def get_elements_for_page(data, page_num):
     """
-    Filter elements for a specific page.
+    Get the elements for a specific page from the precomputed page index.
     
     Args:
         data (dict): Full document JSON data
@@ -156,10 +394,10 @@ def get_elements_for_page(data, page_num):
     Returns:
         list: List of elements on the specified page
     """
-    if not data or "elements" not in data:
+    if not data:
         return []
     
-    return [elem for elem in data["elements"] if elem.get("Page") == page_num]
+    return data.get("_by_page", {}).get(page_num, [])
 
 
 # ============================================================================
@@ -193,18 +431,399 @@ def get_pdf_page_size(data, page_num):
     return 612, 792
 
 
+def get_display_size(img_size):
+    """
+    Scale an image size down so its longest side is at most MAX_DISPLAY_DIM.
+    
+    Args:
+        img_size (tuple): (width, height) of the source image
+    
+    Returns:
+        tuple: (width, height) of the image as displayed
+    """
+    display_scale = min(1.0, MAX_DISPLAY_DIM / max(img_size))
+    return tuple(max(1, round(dim * display_scale)) for dim in img_size)
+
+
+def get_page_image_size(data, page_num, image_path):
+    """
+    Get the displayed pixel size of a page image, memoized in data["_img_size"].
+    
+    This is the size of the (possibly downscaled) image shown in the browser,
+    which is also the coordinate space of click events.
+    
+    Args:
+        data (dict): Full document JSON data
+        page_num (int): Page number (0-indexed)
+        image_path (Path): Path to the page image
+    
+    Returns:
+        tuple: (img_width, img_height) in display pixels
+    """
+    sizes = data.setdefault("_img_size", {})
+    if page_num not in sizes:
+        sizes[page_num] = _read_display_size(str(image_path), image_path.stat().st_mtime_ns)
+    return sizes[page_num]
+
+
+@lru_cache(maxsize=256)
+def _read_display_size(image_path, mtime):
+    """
+    Read an image's display size from its header, memoized by path and mtime.
+    
+    Args:
+        image_path (str): Path to the page image
+        mtime (int): Image modification time in nanoseconds (cache key only)
+    
+    Returns:
+        tuple: (img_width, img_height) in display pixels
+    """
+    # Image.open only parses the header; pixel data is never decoded here
+    with Image.open(image_path) as img:
+        return get_display_size(img.size)
+
+
+def _grid_cell(value, cell_size):
+    """
+    Map an image coordinate to its hit-test grid cell along one axis.
+    
+    The result is clamped to [0, HIT_GRID_SIZE - 1], so coordinates on (or
+    just past) the image edge fall into the outermost cell instead of a
+    cell that find_element_at would never find in the grid.
+    
+    Args:
+        value (float): X or Y coordinate in image space
+        cell_size (float): Width or height of one grid cell
+    
+    Returns:
+        int: Cell index in [0, HIT_GRID_SIZE - 1]
+    """
+    return min(max(int(value // cell_size), 0), HIT_GRID_SIZE - 1)
+
+
+def get_page_bbox_index(data, page_num, img_size):
+    """
+    Build (or fetch) the spatial index used to hit-test clicks on a page.
+    
+    Bounding boxes are converted to image coordinates once and stored in
+    data["_bbox_index"][page_num]. Lookups go through an R-tree when the
+    optional `rtree` package is installed, otherwise through a
+    HIT_GRID_SIZE x HIT_GRID_SIZE grid of element buckets.
+    
+    Args:
+        data (dict): Full document JSON data
+        page_num (int): Page number (0-indexed)
+        img_size (tuple): (img_width, img_height) of the page image
+    
+    Returns:
+        dict: Index with "rects" (N, 4) image coordinates and "elements", plus "tree" or "grid"
+    """
+    indexes = data.setdefault("_bbox_index", {})
+    if page_num in indexes:
+        return indexes[page_num]
+    
+    img_width, img_height = img_size
+    pdf_width, pdf_height = get_pdf_page_size(data, page_num)
+    scale_x = img_width / pdf_width
+    scale_y = img_height / pdf_height
+    
+    # Same PDF -> image transform as draw_bounding_boxes (Y-axis flipped)
+    elements = get_elements_for_page(data, page_num)
+    rects = to_image_rects(get_elements_bounds(data, elements, page_num), scale_x, scale_y, img_height)
+    
+    # Missing or inverted boxes can never contain a click
+    valid = np.isfinite(rects).all(axis=1) & (rects[:, 0] <= rects[:, 2]) & (rects[:, 1] <= rects[:, 3])
+    valid_ids = np.flatnonzero(valid).tolist()
+    
+    index = {"rects": rects, "elements": elements, "tree": None, "grid": None}
+    
+    if rtree_index is not None:
+        tree = rtree_index.Index()
+        for i in valid_ids:
+            tree.insert(i, tuple(rects[i].tolist()))
+        index["tree"] = tree
+    else:
+        cell_w = img_width / HIT_GRID_SIZE
+        cell_h = img_height / HIT_GRID_SIZE
+        grid = {}
+        for i in valid_ids:
+            x1, y1, x2, y2 = rects[i].tolist()
+            for col in range(_grid_cell(x1, cell_w), _grid_cell(x2, cell_w) + 1):
+                for row in range(_grid_cell(y1, cell_h), _grid_cell(y2, cell_h) + 1):
+                    grid.setdefault((col, row), []).append(i)
+        index["grid"] = grid
+        index["cell_size"] = (cell_w, cell_h)
+    
+    indexes[page_num] = index
+    return index
+
+
+def _first_hit_numpy(rects, candidates, x, y):
+    """
+    Return the first candidate row whose rectangle contains (x, y), or -1.
+    
+    Tests all candidates in one vectorized comparison.
+    
+    Args:
+        rects (np.ndarray): (N, 4) image coordinates [x1, y1, x2, y2]
+        candidates (np.ndarray): Row indices to test, in document order
+        x (float): X coordinate in image space
+        y (float): Y coordinate in image space
+    
+    Returns:
+        int: Matching row index, or -1
+    """
+    boxes = rects[candidates]
+    mask = (boxes[:, 0] <= x) & (x <= boxes[:, 2]) & (boxes[:, 1] <= y) & (y <= boxes[:, 3])
+    if not mask.any():
+        return -1
+    return int(candidates[np.argmax(mask)])
+
+
+def _first_hit_loop(rects, candidates, x, y):
+    """
+    Return the first candidate row whose rectangle contains (x, y), or -1.
+    
+    Written as a plain loop for Numba to compile: it stops at the first hit
+    and allocates nothing. Bound to first_hit when Numba is installed.
+    
+    Args:
+        rects (np.ndarray): (N, 4) float64 image coordinates [x1, y1, x2, y2]
+        candidates (np.ndarray): intp row indices to test, in document order
+        x (float): X coordinate in image space
+        y (float): Y coordinate in image space
+    
+    Returns:
+        int: Matching row index, or -1
+    """
+    for k in range(candidates.shape[0]):
+        i = candidates[k]
+        if rects[i, 0] <= x <= rects[i, 2] and rects[i, 1] <= y <= rects[i, 3]:
+            return i
+    return -1
+
+
+# Compiled on first use (and cached on disk) when Numba is installed
+first_hit = njit(cache=True)(_first_hit_loop) if njit is not None else _first_hit_numpy
+
+
+def find_element_at(index, x, y):
+    """
+    Find the first element (in document order) whose box contains a point.
+    
+    The spatial index narrows the search to a few candidate rows, which are
+    then tested against the point by first_hit (Numba-compiled when
+    available, vectorized NumPy otherwise).
+    
+    Args:
+        index (dict): Spatial index from get_page_bbox_index
+        x (float): X coordinate in image space
+        y (float): Y coordinate in image space
+    
+    Returns:
+        dict: The matching element, or None
+    """
+    if index["tree"] is not None:
+        candidates = sorted(index["tree"].intersection((x, y, x, y)))
+    else:
+        cell_w, cell_h = index["cell_size"]
+        candidates = index["grid"].get((_grid_cell(x, cell_w), _grid_cell(y, cell_h)), [])
+    
+    if not candidates:
+        return None
+    
+    hit = first_hit(index["rects"], np.asarray(candidates, dtype=np.intp), float(x), float(y))
+    if hit < 0:
+        return None
+    return index["elements"][hit]
+
+
+def _page_scale(img, data, page_num):
+    """
+    Calculate the PDF-to-image scale factors for a page.
+    
+    The PNG image is rendered at higher resolution than the PDF points.
+    
+    Args:
+        img (PIL.Image): Page image the boxes are drawn on
+        data (dict): Full document JSON data
+        page_num (int): Page number (0-indexed)
+    
+    Returns:
+        tuple: (scale_x, scale_y)
+    """
+    img_width, img_height = img.size
+    pdf_width, pdf_height = get_pdf_page_size(data, page_num)
+    return img_width / pdf_width, img_height / pdf_height
+
+
+def visible_rects_mask(rects, img_size):
+    """
+    Cull rectangles that cannot produce any visible pixels.
+    
+    A rectangle is dropped when it is missing (NaN), lies entirely outside
+    the image, or is narrower/shorter than one pixel (which also covers
+    inverted boxes from bad Bounds values).
+    
+    Args:
+        rects (np.ndarray): (N, 4) image coordinates [x1, y1, x2, y2]
+        img_size (tuple): (img_width, img_height) of the image drawn on
+    
+    Returns:
+        np.ndarray: Boolean mask of shape (N,), True for rectangles to draw
+    """
+    img_width, img_height = img_size
+    x1, y1, x2, y2 = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+    # NaN compares False everywhere, so missing boxes fail these checks too
+    on_canvas = (x2 >= 0) & (y2 >= 0) & (x1 <= img_width) & (y1 <= img_height)
+    big_enough = (x2 - x1 >= 1) & (y2 - y1 >= 1)
+    return on_canvas & big_enough
+
+
+def _draw_outlines(img, elements, data, page_num):
+    """
+    Draw the regular (non-highlighted) outline of every element onto img.
+    
+    Args:
+        img (PIL.Image): Page image to draw on
+        elements (list): Elements on this page
+        data (dict): Full document JSON data
+        page_num (int): Page number (0-indexed)
+    
+    Returns:
+        PIL.Image: The same image, drawn on in place
+    """
+    draw = ImageDraw.Draw(img)
+    scale_x, scale_y = _page_scale(img, data, page_num)
+    rects = to_image_rects(get_elements_bounds(data, elements, page_num), scale_x, scale_y, img.height)
+    drawable = visible_rects_mask(rects, img.size).tolist()
+    
+    # Only the PIL calls remain per element; the coordinate math and
+    # culling are done above. At display resolution each call costs a few
+    # microseconds, far less than building and compositing a page-sized
+    # overlay array would, so the outlines are not batched into one layer.
+    for element, rect, ok in zip(elements, rects.tolist(), drawable):
+        if not ok:
+            continue
+        # Color is normally resolved at load time (see index_document)
+        color = element.get("_color") or get_element_color(get_element_type(element))
+        draw.rectangle(rect, outline=color, width=BBOX_LINE_WIDTH)
+    
+    return img
+
+
+def _draw_highlight(img, elements, data, page_num, highlighted_id):
+    """
+    Draw the selected element(s) with a thicker border and translucent fill.
+    
+    Args:
+        img (PIL.Image): Page image to draw on
+        elements (list): Elements on this page
+        data (dict): Full document JSON data
+        page_num (int): Page number (0-indexed)
+        highlighted_id (int): ObjectID of the element to highlight
+    
+    Returns:
+        PIL.Image: The same image, drawn on in place
+    """
+    scale_x, scale_y = _page_scale(img, data, page_num)
+    rects = to_image_rects(get_elements_bounds(data, elements, page_num), scale_x, scale_y, img.height)
+    drawable = visible_rects_mask(rects, img.size).tolist()
+    
+    # An RGBA draw context blends the translucent fill into the image
+    # in place, touching only the pixels inside the rectangle
+    draw = ImageDraw.Draw(img, 'RGBA')
+    
+    for element, rect, ok in zip(elements, rects.tolist(), drawable):
+        if element.get("ObjectID") != highlighted_id or not ok:
+            continue
+        
+        # Elements that did not go through index_document are resolved here
+        color = element.get("_color") or get_element_color(get_element_type(element))
+        rgb = element.get("_rgb") or get_element_color_rgb(get_element_type(element))
+        draw.rectangle(rect, fill=rgb + (50,), outline=color, width=HIGHLIGHT_LINE_WIDTH)  # 50 = ~20% opacity
+    
+    return img
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _load_display_image(image_path, mtime):
+    """
+    Load a page image downscaled to display resolution, memoized by path and mtime.
+    
+    Boxes are drawn directly on this image: the PDF-to-image scale factors
+    are derived from its size, so they already include the downscale.
+    
+    The image is normalized to RGB here, once, so the drawing code never
+    needs a mode conversion (the highlight fill blends into RGB in place).
+    
+    Args:
+        image_path (str): Path to the page image
+        mtime (int): Image modification time in nanoseconds (cache key only)
+    
+    Returns:
+        PIL.Image: Decoded RGB page image (shared; callers must copy before drawing on it)
+    """
+    img = Image.open(image_path)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    display_size = get_display_size(img.size)
+    if display_size != img.size:
+        return img.resize(display_size, Image.Resampling.LANCZOS)
+    img.load()
+    return img
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_cached(image_path, image_mtime, json_path, json_mtime, page_num, highlighted_id, show_boxes):
+    """
+    Render a page, memoized by image/document file versions and display options.
+    
+    The plain page and the page with all outlines are cached as their own
+    entries, so moving the highlight only copies the outlined base image and
+    draws one extra rectangle instead of redrawing every box.
+    
+    Args:
+        image_path (str): Path to the page image
+        image_mtime (int): Image modification time (cache key only)
+        json_path (str): Path to the document JSON (see _load_cached)
+        json_mtime (int): Document JSON modification time
+        page_num (int): Page number (0-indexed)
+        highlighted_id (int): ObjectID of the element to highlight, or None
+        show_boxes (bool): Whether to draw bounding boxes
+    
+    Returns:
+        PIL.Image: Rendered page (shared; callers must copy before drawing on it)
+    """
+    if not show_boxes:
+        return _load_display_image(image_path, image_mtime)
+    
+    data = _load_cached(json_path, json_mtime)
+    elements = get_elements_for_page(data, page_num)
+    
+    if highlighted_id is None:
+        base = _render_cached(image_path, image_mtime, json_path, json_mtime, page_num, None, False)
+        return _draw_outlines(base.copy(), elements, data, page_num)
+    
+    base = _render_cached(image_path, image_mtime, json_path, json_mtime, page_num, None, True)
+    return _draw_highlight(base.copy(), elements, data, page_num, highlighted_id)
+
+
 def draw_bounding_boxes(image_path, elements, data, page_num, highlighted_id=None, show_boxes=False):
     """
     Draw bounding boxes on the page image.
     
     This function:
-    1. Loads the page image
+    1. Loads the page image, downscaled to at most MAX_DISPLAY_DIM pixels
     2. Gets exact PDF page dimensions from metadata
     3. Calculates scale factors between PDF and image coordinates
     4. Converts PDF coordinates to image coordinates with scaling
     5. Draws colored rectangles for each element (if show_boxes is True)
     6. Highlights the selected element with a thicker border
     
+    Pages of documents loaded through load_document_data are served from
+    a render cache (see _render_cached); any other input is drawn directly.
+    
     Args:
         image_path (Path): Path to the page image
         elements (list): List of elements to draw
@@ -216,74 +835,26 @@ def draw_bounding_boxes(image_path, elements, data, page_num, highlighted_id=Non
     Returns:
         PIL.Image: Image with or without bounding boxes drawn
     """
-    # Load the base image
-    img = Image.open(image_path)
+    image_mtime = image_path.stat().st_mtime_ns
     
-    # If bounding boxes are disabled, return the plain image
+    # Without boxes the highlight is invisible; keep it out of the cache key
     if not show_boxes:
-        return img
-    
-    draw = ImageDraw.Draw(img)
-    
-    # Get image dimensions
-    img_width, img_height = img.size
-    
-    # Get exact PDF page size from metadata
-    pdf_width, pdf_height = get_pdf_page_size(data, page_num)
-    
-    # Calculate scale factors
-    # The PNG image is rendered at higher resolution than the PDF points
-    scale_x = img_width / pdf_width
-    scale_y = img_height / pdf_height
+        highlighted_id = None
     
-    # PDF coordinates have origin at bottom-left, y increases upward
-    # Image coordinates have origin at top-left, y increases downward
+    source = data.get("_source") if data else None
+    if source is not None and elements is get_elements_for_page(data, page_num):
+        img = _render_cached(str(image_path), image_mtime, *source,
+                             page_num, highlighted_id, show_boxes)
+    else:
+        img = _load_display_image(str(image_path), image_mtime)
+        if show_boxes:
+            img = _draw_outlines(img.copy(), elements, data, page_num)
+            if highlighted_id is not None:
+                img = _draw_highlight(img, elements, data, page_num, highlighted_id)
     
-    for element in elements:
-        bounds = element.get("Bounds")
-        if not bounds or len(bounds) != 4:
-            continue
-        
-        # Extract PDF coordinates: [x1, y1, x2, y2]
-        # In PDF: y1 is bottom, y2 is top
-        pdf_x1, pdf_y1, pdf_x2, pdf_y2 = bounds
-        
-        # Scale coordinates to match image resolution
-        scaled_x1 = pdf_x1 * scale_x
-        scaled_x2 = pdf_x2 * scale_x
-        scaled_y1 = pdf_y1 * scale_y
-        scaled_y2 = pdf_y2 * scale_y
-        
-        # Flip Y-axis: image_y = image_height - pdf_y
-        img_y1 = img_height - scaled_y2  # Top in image (was top in PDF)
-        img_y2 = img_height - scaled_y1  # Bottom in image (was bottom in PDF)
-        
-        # Create rectangle coordinates for drawing
-        rect = [scaled_x1, img_y1, scaled_x2, img_y2]
-        
-        # Determine if this element should be highlighted
-        is_highlighted = (highlighted_id is not None and 
-                         element.get("ObjectID") == highlighted_id)
-        
-        # Get color based on element type
-        element_type = get_element_type(element)
-        color = get_element_color(element_type)
-        
-        # Draw the bounding box
-        line_width = HIGHLIGHT_LINE_WIDTH if is_highlighted else BBOX_LINE_WIDTH
-        draw.rectangle(rect, outline=color, width=line_width)
-        
-        # For highlighted elements, also draw a semi-transparent fill
-        if is_highlighted:
-            # Create a semi-transparent overlay
-            overlay = Image.new('RGBA', img.size, (255, 255, 255, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
-            # Convert hex color to RGB with alpha
-            rgb = tuple(int(color.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-            overlay_draw.rectangle(rect, fill=rgb + (50,))  # 50 = ~20% opacity
-            img = Image.alpha_composite(img.convert('RGBA'), overlay)
-            img = img.convert('RGB')
-            draw = ImageDraw.Draw(img)
+    # Remember the page size so click handling doesn't need to reopen the PNG
+    if data is not None:
+        data.setdefault("_img_size", {})[page_num] = img.size
     
     return img
 
@@ -323,7 +894,7 @@ def format_element_json(element, is_highlighted=False):
     Returns:
         str: Formatted JSON string
     """
-    json_str = json.dumps(element, indent=2)
+    json_str = get_element_json(element)
     
     # If highlighted, wrap in HTML for styling
     if is_highlighted:
@@ -332,58 +903,149 @@ def format_element_json(element, is_highlighted=False):
     return json_str
 
 
-def create_json_display(elements, highlighted_id=None):
+def get_element_json(element):
     """
-    Create a formatted JSON display for all elements on the page.
+    Get an element's pretty-printed JSON, using the load-time copy when present.
     
     Args:
-        elements (list): List of elements to display
-        highlighted_id (int): ObjectID of the element to highlight
+        element (dict): Element from the JSON data
     
     Returns:
-        str: HTML-formatted string with all elements wrapped in a scrollable container
+        str: JSON string indented by 2 spaces
     """
-    if not elements:
-        return "<div style='padding: 20px; text-align: center; color: #666; border: 1px solid #ddd; border-radius: 5px;'>No elements on this page</div>"
+    json_str = element.get("_json_pretty")
+    if json_str is None:
+        json_str = json_pretty(public_fields(element))
+    return json_str
+
+
+def _element_html(i, element, is_highlighted):
+    """
+    Build the HTML block for one element in the JSON panel.
     
-    # Create a list of formatted elements
-    output = []
+    Args:
+        i (int): Position of the element on the page (0-indexed)
+        element (dict): Element to display
+        is_highlighted (bool): Whether to highlight this element
     
-    for i, element in enumerate(elements):
-        is_highlighted = (highlighted_id is not None and 
-                         element.get("ObjectID") == highlighted_id)
-        
-        # Add element header with index and type
-        element_type = get_element_type(element)
-        object_id = element.get("ObjectID", "unknown")
-        
-        header_color = "#ff0000" if is_highlighted else "#333333"
-        header = f'<h4 style="color: {header_color}; margin: 0 0 10px 0;">Element {i+1} - Type: {element_type} (ID: {object_id})</h4>'
-        
-        # Format the element JSON
-        json_str = json.dumps(element, indent=2)
-        
-        # Wrap in a styled div
-        bg_color = "#ffffcc" if is_highlighted else "#f5f5f5"
-        border = "2px solid #ff0000" if is_highlighted else "1px solid #ddd"
-        
-        # Add an ID to the highlighted element for auto-scrolling
-        # Add scroll-margin-top to ensure the element is centered when scrolled into view
-        elem_id = f'id="element-{object_id}"' if is_highlighted else ''
-        scroll_margin = 'scroll-margin-top: 100px;' if is_highlighted else ''
-        
-        elem_html = f'''
+    Returns:
+        str: HTML block with a header and the element's JSON
+    """
+    # Add element header with index and type
+    element_type = element.get("_type") or get_element_type(element)
+    object_id = element.get("ObjectID", "unknown")
+    
+    header_color = "#ff0000" if is_highlighted else "#333333"
+    header = f'<h4 style="color: {header_color}; margin: 0 0 10px 0;">Element {i+1} - Type: {element_type} (ID: {object_id})</h4>'
+    
+    # Format the element JSON
+    json_str = get_element_json(element)
+    
+    # Wrap in a styled div
+    bg_color = "#ffffcc" if is_highlighted else "#f5f5f5"
+    border = "2px solid #ff0000" if is_highlighted else "1px solid #ddd"
+    
+    # Add an ID to the highlighted element for auto-scrolling
+    # Add scroll-margin-top to ensure the element is centered when scrolled into view
+    elem_id = f'id="element-{object_id}"' if is_highlighted else ''
+    scroll_margin = 'scroll-margin-top: 100px;' if is_highlighted else ''
+    
+    return f'''
         <div {elem_id} style="background-color: {bg_color}; padding: 10px; border: {border}; 
                     border-radius: 5px; margin: 10px 0; font-family: monospace; white-space: pre-wrap; {scroll_margin}">
             {header}
             <pre style="margin: 5px 0; overflow-x: auto; font-size: 12px;">{json_str}</pre>
         </div>
         '''
-        
-        output.append(elem_html)
+
+
+def get_page_html_blocks(data, page_num):
+    """
+    Get the un-highlighted HTML blocks for a page, memoized in data["_page_html"].
+    
+    Args:
+        data (dict): Full document JSON data
+        page_num (int): Page number (0-indexed)
+    
+    Returns:
+        list: One HTML block per element on the page (shared; do not modify)
+    """
+    cache = data.setdefault("_page_html", {})
+    if page_num not in cache:
+        elements = get_elements_for_page(data, page_num)
+        cache[page_num] = [_element_html(i, element, False) for i, element in enumerate(elements)]
+    return cache[page_num]
+
+
+def _collapsed_blocks(blocks, start, end):
+    """
+    Wrap blocks[start:end] in a collapsed <details> section.
+    
+    Args:
+        blocks (list): HTML blocks for all elements on the page
+        start (int): First block index (inclusive)
+        end (int): Last block index (exclusive)
+    
+    Returns:
+        str: HTML for the collapsed section, or "" if the range is empty
+    """
+    if start >= end:
+        return ""
+    summary = f'Show elements {start+1}-{end} ({end - start} more)'
+    body = "\n".join(blocks[start:end])
+    return f'<details style="margin: 10px 0;"><summary style="cursor: pointer; color: #666; font-family: monospace;">{summary}</summary>{body}</details>'
+
+
+def create_json_display(elements, highlighted_id=None, data=None, page_num=None):
+    """
+    Create a formatted JSON display for all elements on the page.
+    
+    When data and page_num are given and elements is that page's element
+    list, the un-highlighted blocks come from a per-page cache and only the
+    highlighted element's block is rebuilt.
+    
+    Args:
+        elements (list): List of elements to display
+        highlighted_id (int): ObjectID of the element to highlight
+        data (dict): Full document JSON data (optional, enables caching)
+        page_num (int): Page number of the elements (optional, enables caching)
+    
+    Returns:
+        str: HTML-formatted string with all elements wrapped in a scrollable container
+    """
+    if not elements:
+        return "<div style='padding: 20px; text-align: center; color: #666; border: 1px solid #ddd; border-radius: 5px;'>No elements on this page</div>"
+    
+    if data is not None and elements is get_elements_for_page(data, page_num):
+        output = get_page_html_blocks(data, page_num)
+    else:
+        output = [_element_html(i, element, False) for i, element in enumerate(elements)]
+    
+    # Swap in highlighted blocks for the selected element(s) only
+    highlight_index = None
+    if highlighted_id is not None:
+        output = list(output)
+        for i, element in enumerate(elements):
+            if element.get("ObjectID") == highlighted_id:
+                output[i] = _element_html(i, element, True)
+                if highlight_index is None:
+                    highlight_index = i
+    
+    # On busy pages, only expand a window of blocks around the highlighted
+    # element (or the first ones) to keep the rendered DOM small
+    if len(output) > JSON_WINDOW_SIZE:
+        center = highlight_index if highlight_index is not None else 0
+        start = min(max(0, center - JSON_WINDOW_SIZE // 2), len(output) - JSON_WINDOW_SIZE)
+        end = start + JSON_WINDOW_SIZE
+        content = "\n".join([
+            _collapsed_blocks(output, 0, start),
+            *output[start:end],
+            _collapsed_blocks(output, end, len(output)),
+        ])
+    else:
+        content = "\n".join(output)
     
     # Wrap everything in a scrollable container with unique ID
-    content = "\n".join(output)
     container_id = "json-container"
     
     # Add CSS styles for smooth scrolling
@@ -398,49 +1060,11 @@ def create_json_display(elements, highlighted_id=None):
     </style>
     """
     
-    # Add JavaScript to auto-scroll to highlighted element
-    # Using multiple approaches for maximum compatibility
-    scroll_script = ""
-    if highlighted_id is not None:
-        # Add an anchor at the top to enable CSS :target scrolling as fallback
-        anchor = f'<a id="scroll-to-{highlighted_id}"></a>'
-        
-        scroll_script = f'''
-        <script>
-        (function() {{
-            // Wait for DOM to be ready
-            setTimeout(function() {{
-                var container = document.getElementById('{container_id}');
-                var elem = document.getElementById('element-{highlighted_id}');
-                
-                if (container && elem) {{
-                    // Calculate position to center the element in the container
-                    var elemTop = elem.offsetTop;
-                    var containerHeight = container.clientHeight;
-                    var elemHeight = elem.clientHeight;
-                    
-                    // Scroll to center the element
-                    var scrollTo = elemTop - (containerHeight / 2) + (elemHeight / 2);
-                    
-                    // Smooth scroll to the calculated position
-                    container.scrollTo({{
-                        top: Math.max(0, scrollTo),
-                        behavior: 'smooth'
-                    }});
-                    
-                    // Fallback: use scrollIntoView if scrollTo doesn't work
-                    setTimeout(function() {{
-                        elem.scrollIntoView({{ behavior: 'smooth', block: 'center', inline: 'nearest' }});
-                    }}, 50);
-                }}
-            }}, 200);
-        }})();
-        </script>
-        '''
-    else:
-        anchor = ""
+    # The highlighted ObjectID is exposed as a data attribute; the scroll
+    # handler registered once in create_interface reacts to it
+    highlighted_attr = "" if highlighted_id is None else highlighted_id
     
-    return f'{css_styles}<div id="{container_id}" style="height: 1000px; overflow-y: auto; padding: 10px; border: 1px solid #ddd; border-radius: 5px;">{anchor}{content}</div>{scroll_script}'
+    return f'{css_styles}<div id="{container_id}" data-highlighted="{highlighted_attr}" style="height: 1000px; overflow-y: auto; padding: 10px; border: 1px solid #ddd; border-radius: 5px;">{content}</div>'
 
 
 # ============================================================================
@@ -455,19 +1079,19 @@ def load_document(document_name):
         document_name (str): Name of the document to load
     
     Returns:
-        tuple: (image, json_html, page_slider, data, current_page)
+        tuple: (image, json_html, page_slider, current_page)
     """
     # Load the document data
     data = load_document_data(document_name)
     
     if not data:
-        return None, "Error: Could not load document", gr.update(), None, 0
+        return None, "Error: Could not load document", gr.update(), 0
     
     # Get page count
     page_count = data.get("extended_metadata", {}).get("page_count", 0)
     
     if page_count == 0:
-        return None, "Error: No pages found", gr.update(), data, 0
+        return None, "Error: No pages found", gr.update(), 0
     
     # Load first page
     page_num = 0
@@ -486,10 +1110,10 @@ def update_page_display(document_name, data, page_num, highlighted_id=None, show
         show_boxes (bool): Whether to show bounding boxes (default: True)
     
     Returns:
-        tuple: (image, json_html, page_slider_update, data, page_num)
+        tuple: (image, json_html, page_slider_update, page_num)
     """
     if not data:
-        return None, "No document loaded", gr.update(), None, 0
+        return None, "No document loaded", gr.update(), 0
     
     # Get elements for this page
     elements = get_elements_for_page(data, page_num)
@@ -498,22 +1122,22 @@ def update_page_display(document_name, data, page_num, highlighted_id=None, show
     image_path = get_page_image_path(document_name, page_num)
     
     if not image_path:
-        return None, f"Error: Image not found for page {page_num + 1}", gr.update(), data, page_num
+        return None, f"Error: Image not found for page {page_num + 1}", gr.update(), page_num
     
     # Draw the image with or without bounding boxes
     img = draw_bounding_boxes(image_path, elements, data, page_num, highlighted_id, show_boxes)
     
     # Create JSON display
-    json_html = create_json_display(elements, highlighted_id)
+    json_html = create_json_display(elements, highlighted_id, data, page_num)
     
     # Update page slider
     page_count = data.get("extended_metadata", {}).get("page_count", 1)
     slider_update = gr.update(maximum=page_count, value=page_num + 1)
     
-    return img, json_html, slider_update, data, page_num
+    return img, json_html, slider_update, page_num
 
 
-def handle_image_click(document_name, data, page_num, show_boxes, evt: gr.SelectData):
+def handle_image_click(document_name, page_num, show_boxes, evt: gr.SelectData):
     """
     Handle clicks on the image to select bounding boxes.
     
@@ -522,7 +1146,6 @@ def handle_image_click(document_name, data, page_num, show_boxes, evt: gr.Select
     
     Args:
         document_name (str): Name of the current document
-        data (dict): Full document JSON data
         page_num (int): Current page number
         show_boxes (bool): Whether bounding boxes are visible
         evt (gr.SelectData): Gradio event data containing click coordinates
@@ -530,52 +1153,23 @@ def handle_image_click(document_name, data, page_num, show_boxes, evt: gr.Select
     Returns:
         tuple: Updated display with highlighted element
     """
+    # Parsed documents live in the server-side load cache, keyed by name
+    data = load_document_data(document_name) if document_name else None
     if not data:
-        return None, "No document loaded", gr.update(), data, page_num
+        return None, "No document loaded", gr.update(), page_num
     
     # Get click coordinates (in image space)
     click_x, click_y = evt.index[0], evt.index[1]
     
-    # Get elements for this page
-    elements = get_elements_for_page(data, page_num)
-    
-    # Get image dimensions and calculate scale factors
+    # Locate the page image
     image_path = get_page_image_path(document_name, page_num)
     if not image_path:
-        return None, "Error: Image not found", gr.update(), data, page_num
-    
-    img = Image.open(image_path)
-    img_width, img_height = img.size
-    
-    # Get exact PDF page size from metadata and calculate scale factors
-    pdf_width, pdf_height = get_pdf_page_size(data, page_num)
-    scale_x = img_width / pdf_width
-    scale_y = img_height / pdf_height
+        return None, "Error: Image not found", gr.update(), page_num
     
-    # Find the element at the clicked location
-    clicked_element = None
-    for element in elements:
-        bounds = element.get("Bounds")
-        if not bounds or len(bounds) != 4:
-            continue
-        
-        # Get PDF coordinates
-        pdf_x1, pdf_y1, pdf_x2, pdf_y2 = bounds
-        
-        # Scale to image coordinates
-        scaled_x1 = pdf_x1 * scale_x
-        scaled_x2 = pdf_x2 * scale_x
-        scaled_y1 = pdf_y1 * scale_y
-        scaled_y2 = pdf_y2 * scale_y
-        
-        # Flip Y-axis to image coordinates
-        img_y1 = img_height - scaled_y2
-        img_y2 = img_height - scaled_y1
-        
-        # Check if click is within this bounding box
-        if scaled_x1 <= click_x <= scaled_x2 and img_y1 <= click_y <= img_y2:
-            clicked_element = element
-            break
+    # Query the page's spatial index instead of scanning every element
+    img_size = get_page_image_size(data, page_num, image_path)
+    index = get_page_bbox_index(data, page_num, img_size)
+    clicked_element = find_element_at(index, click_x, click_y)
     
     if clicked_element:
         highlighted_id = clicked_element.get("ObjectID")
@@ -615,8 +1209,9 @@ def create_interface():
         4. Different colors represent different element types
         """)
         
-        # State variables to store current document data
-        doc_data = gr.State(None)
+        # State variables to store the current view.
+        # Only the document name is kept per session; the parsed document is
+        # looked up in the server-side cache behind load_document_data.
         current_doc = gr.State("")
         current_page = gr.State(0)
         show_bbox_state = gr.State(False)  # Global state for bounding box visibility (hidden by default)
@@ -707,6 +1302,46 @@ def create_interface():
         </style>
         """)
         
+        # Auto-scroll the JSON panel to the highlighted element.
+        # Registered once on page load: <script> tags inside gr.HTML output are
+        # not executed, so the handler watches for new panel HTML instead and
+        # reads the container's data-highlighted attribute.
+        app.load(fn=None, js="""
+        () => {
+            const scrollToHighlight = (container, highlightedId) => {
+                const elem = document.getElementById('element-' + highlightedId);
+                if (!elem) {
+                    return;
+                }
+                // Center the element in the container. Measure its offset
+                // relative to the container itself (offsetTop would be
+                // relative to the nearest positioned ancestor instead)
+                const elemTop = elem.getBoundingClientRect().top
+                    - container.getBoundingClientRect().top + container.scrollTop;
+                const scrollTo = elemTop - (container.clientHeight / 2) + (elem.clientHeight / 2);
+                container.scrollTo({ top: Math.max(0, scrollTo), behavior: 'smooth' });
+            };
+            
+            // Handle each new panel (or changed highlight) exactly once
+            new MutationObserver(() => {
+                const container = document.getElementById('json-container');
+                if (!container || container.dataset.scrolledTo === container.dataset.highlighted) {
+                    return;
+                }
+                const highlightedId = container.dataset.highlighted;
+                container.dataset.scrolledTo = highlightedId;
+                if (highlightedId) {
+                    requestAnimationFrame(() => scrollToHighlight(container, highlightedId));
+                }
+            }).observe(document.body, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                attributeFilter: ['data-highlighted'],
+            });
+        }
+        """)
+        
         # Event handlers
         
         # When a document is selected, load it
@@ -715,37 +1350,44 @@ def create_interface():
             if not doc or doc == "":
                 # No document selected or empty option - return empty state (no scrollbar)
                 empty_message = "<div style='padding: 20px; text-align: center; color: #666; border: 1px solid #ddd; border-radius: 5px;'><p style='margin-top: 100px; font-size: 16px;'>👆 Select a document from the dropdown above to begin</p><p style='font-size: 14px; color: #999;'>Click on any bounding box to view its JSON metadata</p></div>"
-                return "", None, empty_message, gr.update(maximum=1, value=1), None, 0
+                return "", None, empty_message, gr.update(maximum=1, value=1), 0
             
             # Load the selected document (respecting current bbox state)
             data = load_document_data(doc)
             if not data:
-                return doc, None, "Error: Could not load document", gr.update(), None, 0
+                return doc, None, "Error: Could not load document", gr.update(), 0
             
             # Load first page with current bbox state
-            img, json_html, slider_update, data_out, page = update_page_display(doc, data, 0, None, show_boxes)
-            return doc, img, json_html, slider_update, data_out, page
+            img, json_html, slider_update, page = update_page_display(doc, data, 0, None, show_boxes)
+            return doc, img, json_html, slider_update, page
         
         doc_dropdown.change(
             fn=on_document_change,
             inputs=[doc_dropdown, show_bbox_state],
-            outputs=[current_doc, image_display, json_display, page_slider, doc_data, current_page]
+            outputs=[current_doc, image_display, json_display, page_slider, current_page]
         )
         
-        # When page slider changes
-        def on_page_change(doc, data, page, show_boxes):
-            """Handle page slider change"""
+        # When the user moves the page slider.
+        # input fires only for user interaction (drag ticks, arrow keys, typed
+        # page numbers), never for the value updates the other handlers push to
+        # the slider. "always_last" keeps at most one render running and one
+        # queued, so a drag renders a few intermediate pages and always ends on
+        # the page the slider stopped at.
+        def on_page_change(doc, page, show_boxes):
+            """Handle user page slider input"""
+            data = load_document_data(doc) if doc else None
             # Convert from 1-indexed slider to 0-indexed page number
             return update_page_display(doc, data, int(page) - 1, None, show_boxes)
         
-        page_slider.change(
+        page_slider.input(
             fn=on_page_change,
-            inputs=[current_doc, doc_data, page_slider, show_bbox_state],
-            outputs=[image_display, json_display, page_slider, doc_data, current_page]
+            inputs=[current_doc, page_slider, show_bbox_state],
+            outputs=[image_display, json_display, page_slider, current_page],
+            trigger_mode="always_last"
         )
         
         # When toggle button is clicked
-        def on_bbox_toggle(doc, data, page, current_state):
+        def on_bbox_toggle(doc, page, current_state):
             """Toggle bounding box visibility"""
             # Toggle the state
             new_state = not current_state
@@ -757,24 +1399,25 @@ def create_interface():
                 btn_text = "🔳 Show Bounding Boxes"
             
             # If no document loaded, just update button and state
-            if not doc or not data:
-                return gr.update(value=btn_text), None, gr.update(), data, page, new_state
+            data = load_document_data(doc) if doc else None
+            if not data:
+                return gr.update(value=btn_text), None, gr.update(), page, new_state
             
             # Update the display with new state
-            img, json_html, slider, data_out, page_out = update_page_display(doc, data, page, None, new_state)
-            return gr.update(value=btn_text), img, json_html, data_out, page_out, new_state
+            img, json_html, slider, page_out = update_page_display(doc, data, page, None, new_state)
+            return gr.update(value=btn_text), img, json_html, page_out, new_state
         
         toggle_bbox_btn.click(
             fn=on_bbox_toggle,
-            inputs=[current_doc, doc_data, current_page, show_bbox_state],
-            outputs=[toggle_bbox_btn, image_display, json_display, doc_data, current_page, show_bbox_state]
+            inputs=[current_doc, current_page, show_bbox_state],
+            outputs=[toggle_bbox_btn, image_display, json_display, current_page, show_bbox_state]
         )
         
         # When user clicks on the image
         image_display.select(
             fn=handle_image_click,
-            inputs=[current_doc, doc_data, current_page, show_bbox_state],
-            outputs=[image_display, json_display, page_slider, doc_data, current_page]
+            inputs=[current_doc, current_page, show_bbox_state],
+            outputs=[image_display, json_display, page_slider, current_page]
         )
         
         # Start with empty panels - no document loaded initially